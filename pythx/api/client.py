@@ -93,6 +93,8 @@ class Client:
             if AnalysisCacheMiddleware not in type_list:
                 middlewares.append(AnalysisCacheMiddleware(no_cache))
 
+        # only close the handler's session on exit if we created the handler ourselves
+        self._owns_handler = handler is None
         self.handler = handler or APIHandler(middlewares=middlewares, api_url=api_url)
         self.api_key = api_key
         self.refresh_token = refresh_token
@@ -130,7 +132,14 @@ class Client:
         )
         req_dict = self.handler.assemble_request(req_obj)
         LOGGER.debug("Sending request")
-        resp = self.handler.send_request(req_dict, auth_header=auth_header)
+        session = getattr(self.handler, "session", None)
+        if session is not None:
+            resp = self.handler.send_request(
+                req_dict, auth_header=auth_header, session=session
+            )
+        else:
+            # custom handlers are not required to provide a session
+            resp = self.handler.send_request(req_dict, auth_header=auth_header)
         LOGGER.debug("Parsing response")
         return self.handler.parse_response(resp, resp_model)
 
@@ -160,7 +169,6 @@ class Client:
             return
         now = datetime.utcnow()
         access_expiration = self._get_jwt_expiration_ts(self.api_key)
-        refresh_expiration = self._get_jwt_expiration_ts(self.refresh_token)
         if now < access_expiration:
             # auth token still valid - continue
             LOGGER.debug(
@@ -168,7 +176,9 @@ class Client:
                     now, access_expiration
                 )
             )
-        elif access_expiration < now < refresh_expiration:
+            return
+        refresh_expiration = self._get_jwt_expiration_ts(self.refresh_token)
+        if access_expiration < now < refresh_expiration:
             # access token expired, but refresh token hasn't - use it to get new access token
             LOGGER.debug(
                 "Auth refresh needed: {} < {} < {}".format(
@@ -501,4 +511,8 @@ class Client:
         :param exc_value: The exception value from context execution
         :param traceback: The traceback from context execution
         """
-        self.logout()
+        try:
+            self.logout()
+        finally:
+            if self._owns_handler:
+                self.handler.close()
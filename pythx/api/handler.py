@@ -51,6 +51,11 @@ class APIHandler:
     to the configured endpoint, parsing the response into its respective
     domain model, as well as registering and executing request/response
     middlewares.
+
+    Each handler owns a :code:`requests.Session` that the client uses to reuse
+    pooled connections between requests. As :code:`requests` does not document its
+    sessions as thread-safe, a handler (and the client using it) should not be
+    shared across threads; create one client per thread instead.
     """
 
     def __init__(
@@ -66,6 +71,26 @@ class APIHandler:
         self.api_url = self._normalize_url(
             api_url or os.environ.get("MYTHX_API_URL") or DEFAULT_API_URL
         )
+        self._session = None
+
+    @property
+    def session(self) -> requests.Session:
+        """The handler's HTTP session, created on first use.
+
+        :return: The :code:`requests.Session` pooling this handler's connections
+        """
+        if getattr(self, "_session", None) is None:
+            self._session = requests.Session()
+        return self._session
+
+    def close(self) -> None:
+        """Close the handler's HTTP session.
+
+        :return: None
+        """
+        if getattr(self, "_session", None) is not None:
+            self._session.close()
+            self._session = None
 
     @staticmethod
     def _normalize_url(url: str) -> str:
@@ -83,7 +108,11 @@ class APIHandler:
         return url + "/" if not url.endswith("/") else url
 
     @staticmethod
-    def send_request(request_data: Dict, auth_header: Dict[str, str] = None) -> Dict:
+    def send_request(
+        request_data: Dict,
+        auth_header: Dict[str, str] = None,
+        session: requests.Session = None,
+    ) -> Dict:
         """Send a request to the API.
 
         This method takes a data dictionary holding the request's method (HTTP verb),
@@ -106,10 +135,16 @@ class APIHandler:
         If the action requires authentication, the auth headers are passed in a separate, optional
         parameter. It holds the user's JWT access token.
 
+        If a :code:`requests.Session` is given, the request is sent through it, so repeated
+        calls (e.g. when polling an analysis job's status) reuse the same HTTP connection
+        instead of performing a new TCP and TLS handshake each time. Otherwise a one-off
+        request is made.
+
         If the request fails (returns a non 200 status code), a :code:`MythXAPIError` is raised.
 
         :param request_data: The request data dictionary
         :param auth_header: The authorization header carrying the access token
+        :param session: An optional session to send the request through
         :return: The raw response payload string
         """
         if auth_header is None:
@@ -120,11 +155,14 @@ class APIHandler:
         url = request_data["url"]
         payload = request_data["payload"]
         params = request_data["params"]
-        response = requests.request(
+        send = session.request if session is not None else requests.request
+        response = send(
             method=method, url=url, headers=headers, json=payload, params=params
         )
-        LOGGER.debug(print_request(response.request))
-        LOGGER.debug(print_response(response))
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            # only pay for pretty-printing the full exchange if it gets logged
+            LOGGER.debug(print_request(response.request))
+            LOGGER.debug(print_response(response))
         if not 199 < response.status_code < 300:
             raise MythXAPIError(
                 "Got unexpected status code {}: {}".format(
@@ -1,3 +1,6 @@
+import logging
+from unittest.mock import patch
+
 import pytest
 from mythx_models import response as respmodels
 from mythx_models.exceptions import MythXAPIError
@@ -216,3 +219,65 @@ def test_send_request_unauthenticated(requests_mock):
     assert h.method == "GET"
     assert h.url == test_url
     assert h.headers.get("Authorization") is None
+
+
+def test_send_request_reuses_session(requests_mock):
+    test_url = "mock://test.com/path"
+    requests_mock.get(test_url, text='{"resp":"test"}')
+    handler = APIHandler()
+    session = handler.session
+    with patch.object(session, "request", wraps=session.request) as request_mock:
+        for _ in range(2):
+            APIHandler.send_request(
+                {
+                    "method": "GET",
+                    "headers": {},
+                    "url": test_url,
+                    "payload": {},
+                    "params": {},
+                },
+                session=handler.session,
+            )
+    assert handler.session is session
+    assert request_mock.call_count == 2
+    assert requests_mock.call_count == 2
+
+
+class NoInitHandler(APIHandler):
+    def __init__(self):
+        # deliberately skip APIHandler.__init__
+        pass
+
+
+def test_send_request_without_super_init(requests_mock):
+    test_url = "mock://test.com/path"
+    requests_mock.get(test_url, text='{"resp":"test"}')
+    handler = NoInitHandler()
+    resp = handler.send_request(
+        {"method": "GET", "headers": {}, "url": test_url, "payload": {}, "params": {}},
+        session=handler.session,
+    )
+    assert resp == {"resp": "test"}
+    assert requests_mock.call_count == 1
+    handler.close()
+
+
+@pytest.mark.parametrize("level,calls", [(logging.INFO, 0), (logging.DEBUG, 1)])
+def test_send_request_debug_dumps(requests_mock, caplog, level, calls):
+    test_url = "mock://test.com/path"
+    requests_mock.get(test_url, text='{"resp":"test"}')
+    caplog.set_level(level, logger="pythx.api.handler")
+    with patch("pythx.api.handler.print_request", return_value="") as req_mock, patch(
+        "pythx.api.handler.print_response", return_value=""
+    ) as resp_mock:
+        APIHandler.send_request(
+            {
+                "method": "GET",
+                "headers": {},
+                "url": test_url,
+                "payload": {},
+                "params": {},
+            }
+        )
+    assert req_mock.call_count == calls
+    assert resp_mock.call_count == calls
@@ -1,5 +1,6 @@
 from copy import copy
 from datetime import datetime
+from unittest.mock import patch
 
 import jwt
 import mythx_models.response as respmodels
@@ -346,12 +347,57 @@ def test_jwt_expiration():
     )
 
 
+def test_valid_access_token_skips_refresh_token_decode():
+    client = get_client([])
+    with patch.object(
+        Client, "_get_jwt_expiration_ts", return_value=datetime(9999, 1, 1)
+    ) as decode_mock:
+        client.assert_authentication()
+    decode_mock.assert_called_once_with(client.api_key)
+
+
 def test_context_handler():
     test_dict = get_test_case("testdata/auth-logout-response.json")
     with get_client([test_dict]) as c:
         assert c is not None
 
 
+def test_context_handler_closes_own_handler():
+    client = Client(api_key="test")
+    with patch.object(client, "logout"), patch.object(
+        client.handler, "close"
+    ) as close_mock:
+        with client as c:
+            assert c is not None
+    close_mock.assert_called_once_with()
+
+
+class DuckTypedHandler:
+    """A handler without session support or a :code:`close` method."""
+
+    def __init__(self, resp):
+        self.handler = APIHandler()
+        self.resp = resp
+
+    def assemble_request(self, req):
+        return self.handler.assemble_request(req)
+
+    def send_request(self, request_data, auth_header=None):
+        return self.resp.pop(0)
+
+    def parse_response(self, resp, model_cls):
+        return self.handler.parse_response(resp, model_cls)
+
+
+def test_context_handler_without_close():
+    test_dict = get_test_case("testdata/auth-logout-response.json")
+    client = get_client([])
+    client.handler = DuckTypedHandler([test_dict])
+    with client as c:
+        assert c is not None
+    assert client.api_key is None
+
+
 def test_custom_middlewares():
     assert_middlewares(Client())
     assert_middlewares(Client(middlewares=None))